@@ -2,19 +2,27 @@ package main
 
 import (
 	"archive/zip"
+	"bytes"
+	"crypto/sha1"
 	"database/sql"
+	"encoding/hex"
 	"encoding/json"
+	"errors"
 	"fmt"
 	"io"
 	"log"
+	"math/rand"
+	"net/url"
 	"os"
 	"path/filepath"
 	"regexp"
+	"sort"
 	"strconv"
 	"strings"
+	"sync"
 	"time"
 
-	_ "github.com/mattn/go-sqlite3"
+	"github.com/mattn/go-sqlite3"
 )
 
 // Config holds configuration settings from environment
@@ -24,6 +32,7 @@ type Config struct {
 	MyTitle     string
 	MyTitleProg string
 	DBPath      string
+	CacheFolder string
 	ShowEvents  bool
 }
 
@@ -53,25 +62,23 @@ type AlfredMod struct {
 
 // Row represents a database row result
 type RulerRow struct {
-	RulerID            int
-	Name               string
-	PersonalName       sql.NullString
-	Epithet            sql.NullString
-	Wikipedia          sql.NullString
-	Notes              sql.NullString
-	Biography          sql.NullString
-	PeriodID           int
-	TitleID            int
-	Title              string
-	TitlePlural        sql.NullString
-	TitleCount         int
-	Period             string
-	ProgrTitle         int
-	StartYear          int
-	EndYear            int
-	Year               sql.NullInt64
-	ConcatenatedTitles sql.NullString
-	ConcatenatedNotes  sql.NullString
+	RulerID      int
+	Name         string
+	PersonalName sql.NullString
+	Epithet      sql.NullString
+	Wikipedia    sql.NullString
+	Notes        sql.NullString
+	Biography    sql.NullString
+	PeriodID     int
+	TitleID      int
+	Title        string
+	TitlePlural  sql.NullString
+	TitleCount   int
+	Period       string
+	ProgrTitle   int
+	StartYear    int
+	EndYear      int
+	Year         sql.NullInt64
 }
 
 // EventRow represents an event database row result
@@ -85,6 +92,52 @@ type EventRow struct {
 	Year      sql.NullInt64
 }
 
+// Bundled database archive and the database file extracted from it
+const (
+	zipName = "whoWasWhen.db.zip"
+	dbName  = "whoWasWhen.db"
+)
+
+// sqliteDriver is the go-sqlite3 driver registered with connPragmas
+const sqliteDriver = "sqlite3_whowaswhen"
+
+// connPragmas are applied to every connection the pool opens. Ruler and event
+// searches run concurrently on separate connections, so a one-off db.Exec
+// would only configure whichever connection happened to run it.
+var connPragmas = []string{
+	"PRAGMA case_sensitive_like=OFF",
+	// The workflow never writes to the shipped database
+	"PRAGMA query_only=ON",
+	// Map the database file into memory; the OS page cache then serves reads
+	// across keystrokes without a read() per page
+	"PRAGMA mmap_size=268435456",
+	// Keep GROUP BY / ORDER BY scratch b-trees off disk
+	"PRAGMA temp_store=MEMORY",
+	// 16 MiB page cache (negative values are in KiB)
+	"PRAGMA cache_size=-16384",
+}
+
+// readOnlyDSN returns a SQLite URI opening the database read-only. It is not
+// marked immutable: Alfred runs a process per keystroke, and another process
+// may replace the database (see ensureDatabase) while this one has it open.
+func readOnlyDSN(path string) string {
+	u := url.URL{Scheme: "file", Path: path, RawQuery: "mode=ro"}
+	return u.String()
+}
+
+func init() {
+	sql.Register(sqliteDriver, &sqlite3.SQLiteDriver{
+		ConnectHook: func(conn *sqlite3.SQLiteConn) error {
+			for _, pragma := range connPragmas {
+				if _, err := conn.Exec(pragma, nil); err != nil {
+					return fmt.Errorf("error setting pragma %q: %w", pragma, err)
+				}
+			}
+			return nil
+		},
+	})
+}
+
 func getConfig() Config {
 	// Get Alfred workflow data path from environment or use default
 	dataFolder := os.Getenv("alfred_workflow_data")
@@ -109,7 +162,8 @@ func getConfig() Config {
 		MyRulerID:   os.Getenv("myRulerID"),
 		MyTitle:     os.Getenv("myTitle"),
 		MyTitleProg: os.Getenv("mytitleProg"),
-		DBPath:      filepath.Join(dataFolder, "whoWasWhen.db"),
+		DBPath:      filepath.Join(dataFolder, dbName),
+		CacheFolder: os.Getenv("alfred_workflow_cache"),
 		ShowEvents:  showEvents,
 	}
 }
@@ -119,6 +173,181 @@ func logMsg(format string, v ...interface{}) {
 	fmt.Fprintf(os.Stderr, format+"\n", v...)
 }
 
+// output is where writeResult sends results; main tees it into the query cache
+var output io.Writer = os.Stdout
+
+// writeResult encodes the Alfred result directly to the output, avoiding the
+// intermediate []byte -> string copy of json.Marshal + fmt.Println
+func writeResult(result AlfredResult) error {
+	return json.NewEncoder(output).Encode(result)
+}
+
+// errNoResults reports that a search only produced the "No results" item, which
+// is not worth caching
+var errNoResults = errors.New("no results")
+
+// maxCachedQueries bounds the number of results kept in the query cache
+const maxCachedQueries = 500
+
+// pruneInterval is the average number of stores between cache prunes; the
+// cache may overshoot maxCachedQueries by about this many files in between
+const pruneInterval = 20
+
+// staleTempAge is how old a temporary cache file must be before it is treated
+// as abandoned; a live run renames its file well within this time
+const staleTempAge = time.Minute
+
+// cacheFormatVersion is part of every query cache key. The executable's identity
+// already invalidates the cache when a new build is installed; bumping this is
+// a backstop for output changes that keep the same binary (e.g. tests).
+var cacheFormatVersion = "1"
+
+// executableID identifies the running build by the size and modification time
+// of its binary, or returns "" if the executable cannot be found
+func executableID() string {
+	path, err := os.Executable()
+	if err != nil {
+		return ""
+	}
+	info, err := os.Stat(path)
+	if err != nil {
+		return ""
+	}
+	return fmt.Sprintf("%d:%d", info.Size(), info.ModTime().UnixNano())
+}
+
+// queryCachePath returns the cache file for the output of a query identified
+// by key, or "" when Alfred provides no cache folder. The database's size and
+// modification time are part of the key, so a re-extracted database never
+// serves stale results; so are the running build, so an updated workflow never
+// serves output in an old format, and mySource, which byYear writes into the
+// result.
+func queryCachePath(config Config, key ...string) string {
+	if config.CacheFolder == "" {
+		return ""
+	}
+	info, err := os.Stat(config.DBPath)
+	if err != nil {
+		return ""
+	}
+	h := sha1.New()
+	fmt.Fprintf(h, "%s\x00%s\x00%d\x00%d\x00%s", cacheFormatVersion, executableID(), info.Size(), info.ModTime().UnixNano(), config.MySource)
+	for _, k := range key {
+		fmt.Fprintf(h, "\x00%s", k)
+	}
+	return filepath.Join(config.CacheFolder, "queries", hex.EncodeToString(h.Sum(nil))+".json")
+}
+
+// serveCached copies a cached result to stdout, reporting whether one existed
+func serveCached(path string) bool {
+	data, err := os.ReadFile(path)
+	if err != nil {
+		return false
+	}
+	if _, err := os.Stdout.Write(data); err != nil {
+		logMsg("Error writing cached result: %v", err)
+	}
+	return true
+}
+
+// cacheResult stores a run's output in the query cache, unless the search
+// failed or only produced the "No results" item
+func cacheResult(path string, data []byte, searchErr error) {
+	if searchErr != nil || len(data) == 0 {
+		return
+	}
+	storeCached(path, data)
+}
+
+// storeCached saves a result to the query cache. It writes a temporary file and
+// renames it into place, so a concurrent run never reads a partial result.
+func storeCached(path string, data []byte) {
+	dir := filepath.Dir(path)
+	if err := os.MkdirAll(dir, 0o755); err != nil {
+		logMsg("Error creating cache folder: %v", err)
+		return
+	}
+	tmp, err := os.CreateTemp(dir, "*.tmp")
+	if err != nil {
+		logMsg("Error creating cache file: %v", err)
+		return
+	}
+	_, err = tmp.Write(data)
+	if closeErr := tmp.Close(); err == nil {
+		err = closeErr
+	}
+	if err == nil {
+		err = os.Rename(tmp.Name(), path)
+	}
+	if err != nil {
+		os.Remove(tmp.Name())
+		logMsg("Error writing cache file: %v", err)
+		return
+	}
+	// Every run is a separate process, so prune on a random 1-in-pruneInterval
+	// of stores rather than reading the cache folder on every keystroke
+	if rand.Intn(pruneInterval) == 0 {
+		pruneQueryCache(dir)
+	}
+}
+
+// pruneQueryCache removes the oldest cached results beyond maxCachedQueries,
+// along with temporary files left behind by runs that died before renaming them.
+// Only .tmp entries are stat'ed unless the cache is over its limit.
+func pruneQueryCache(dir string) {
+	entries, err := os.ReadDir(dir)
+	if err != nil {
+		return
+	}
+	var results []os.DirEntry
+	for _, entry := range entries {
+		switch filepath.Ext(entry.Name()) {
+		case ".json":
+			results = append(results, entry)
+		case ".tmp":
+			if info, err := entry.Info(); err == nil && time.Since(info.ModTime()) > staleTempAge {
+				os.Remove(filepath.Join(dir, entry.Name()))
+			}
+		}
+	}
+	if len(results) <= maxCachedQueries {
+		return
+	}
+
+	type cachedFile struct {
+		name    string
+		modTime time.Time
+	}
+	files := make([]cachedFile, 0, len(results))
+	for _, entry := range results {
+		if info, err := entry.Info(); err == nil {
+			files = append(files, cachedFile{entry.Name(), info.ModTime()})
+		}
+	}
+	if len(files) <= maxCachedQueries {
+		return
+	}
+	sort.Slice(files, func(i, j int) bool {
+		return files[i].modTime.Before(files[j].modTime)
+	})
+	for _, f := range files[:len(files)-maxCachedQueries] {
+		os.Remove(filepath.Join(dir, f.name))
+	}
+}
+
+// addCounters prefixes each item's subtitle with its "n/total" position
+func addCounters(items []AlfredItem) {
+	// The total is the same for every item, so format it only once
+	total := formatNumber(len(items))
+	for i := range items {
+		if items[i].Subtitle != "" {
+			items[i].Subtitle = fmt.Sprintf("%s/%s %s", formatNumber(i+1), total, items[i].Subtitle)
+		} else {
+			items[i].Subtitle = fmt.Sprintf("%s/%s", formatNumber(i+1), total)
+		}
+	}
+}
+
 // Format duration with appropriate units
 func formatDuration(d time.Duration) string {
 	if d < time.Millisecond {
@@ -159,9 +388,6 @@ func ensureDatabase(dataFolder string) error {
 		}
 	}
 
-	const zipName = "whoWasWhen.db.zip"
-	const dbName = "whoWasWhen.db"
-
 	cwd, err := os.Getwd()
 	if err != nil {
 		return fmt.Errorf("cannot determine current directory: %w", err)
@@ -210,10 +436,29 @@ func ensureDatabase(dataFolder string) error {
 			return fmt.Errorf("unzipped database %s not found in archive", dbName)
 		}
 
-		// Copy (not rename) to support cross-filesystem moves
-		if err := copyFile(extractedDBPath, dbDestPath); err != nil {
+		// Copy (not rename) to support cross-filesystem moves. The copy goes to a
+		// temporary file next to the destination and is renamed over it, so a
+		// process that already has the old database open (and memory-mapped)
+		// keeps reading the old file instead of seeing it truncated.
+		removeStaleDBCopies(dataFolder)
+		tmp, err := os.CreateTemp(dataFolder, dbName+".*.tmp")
+		if err != nil {
+			return fmt.Errorf("error creating temporary database file: %w", err)
+		}
+		tmp.Close()
+		if err := copyFile(extractedDBPath, tmp.Name()); err != nil {
+			os.Remove(tmp.Name())
 			return fmt.Errorf("error copying database to data folder: %w", err)
 		}
+		// CreateTemp makes the file 0600; install the database as 0644, as before
+		if err := os.Chmod(tmp.Name(), 0o644); err != nil {
+			os.Remove(tmp.Name())
+			return fmt.Errorf("error setting database permissions: %w", err)
+		}
+		if err := os.Rename(tmp.Name(), dbDestPath); err != nil {
+			os.Remove(tmp.Name())
+			return fmt.Errorf("error moving database into place: %w", err)
+		}
 
 		// Clean-up zip and temp directory
 		_ = os.Remove(zipPath)
@@ -229,6 +474,21 @@ func ensureDatabase(dataFolder string) error {
 	return nil
 }
 
+// removeStaleDBCopies deletes temporary database copies left in the data folder
+// by runs that Alfred killed mid-extraction. Copies younger than staleTempAge
+// may belong to a run still in progress and are kept.
+func removeStaleDBCopies(dataFolder string) {
+	matches, err := filepath.Glob(filepath.Join(dataFolder, dbName+".*.tmp"))
+	if err != nil {
+		return
+	}
+	for _, path := range matches {
+		if info, err := os.Stat(path); err == nil && time.Since(info.ModTime()) > staleTempAge {
+			os.Remove(path)
+		}
+	}
+}
+
 // unzipFile extracts the contents of srcZip into destDir.
 func unzipFile(srcZip, destDir string) error {
 	zr, err := zip.OpenReader(srcZip)
@@ -295,6 +555,23 @@ func copyFile(src, dst string) error {
 	return out.Sync()
 }
 
+// goBackMod builds the cmd+alt modifier that restores the original query.
+// It is the same for every item of a result, so callers build it once.
+func goBackMod(originalQuery string) AlfredMod {
+	return AlfredMod{
+		Valid:    true,
+		Arg:      originalQuery,
+		Subtitle: "Go back to main search",
+		Variables: map[string]string{
+			"mySource":      "",
+			"myRulerID":     "",
+			"mytitleProg":   "",
+			"myTitle":       "",
+			"restoredQuery": originalQuery,
+		},
+	}
+}
+
 // Helper function to get plural title with fallback
 func getTitlePlural(titlePlural sql.NullString, title string) string {
 	if titlePlural.Valid && titlePlural.String != "" {
@@ -311,8 +588,51 @@ func formatYear(year int) string {
 	return fmt.Sprintf("%d", year)
 }
 
+// iconPaths memoizes getIconPath, so each title's icon is stat'ed only once.
+// Searches build results on several goroutines, so access goes through the mutex.
+var (
+	iconPathsMu sync.Mutex
+	iconPaths   = make(map[string]string)
+)
+
+// getIconPath returns the icon for a title, or the default crown if the
+// workflow has no icon file for it
+func getIconPath(title string) string {
+	iconPathsMu.Lock()
+	defer iconPathsMu.Unlock()
+	if iconPath, ok := iconPaths[title]; ok {
+		return iconPath
+	}
+	iconPath := fmt.Sprintf("icons/%s.png", title)
+	if _, err := os.Stat(iconPath); os.IsNotExist(err) {
+		iconPath = "icons/crown.png"
+	}
+	iconPaths[title] = iconPath
+	return iconPath
+}
+
+// titleRanks memoizes getTitleRank, which is called repeatedly for the same few
+// titles. Searches build results on several goroutines, so access goes through
+// the mutex.
+var (
+	titleRanksMu sync.Mutex
+	titleRanks   = make(map[string]int)
+)
+
 // Helper function to get title ranking (lower number = higher priority)
 func getTitleRank(title string) int {
+	titleRanksMu.Lock()
+	defer titleRanksMu.Unlock()
+	if rank, ok := titleRanks[title]; ok {
+		return rank
+	}
+	rank := computeTitleRank(title)
+	titleRanks[title] = rank
+	return rank
+}
+
+// computeTitleRank ranks a title by matching it against known ruler categories
+func computeTitleRank(title string) int {
 	titleLower := strings.ToLower(title)
 
 	// Highest priority - Emperors
@@ -399,14 +719,13 @@ func formatSubtitle(periods []PeriodInfo, personalName sql.NullString) string {
 		})
 	}
 
-	// Sort by rank (lower number = higher priority)
-	for i := 0; i < len(sortedTitleGroups); i++ {
-		for j := i + 1; j < len(sortedTitleGroups); j++ {
-			if sortedTitleGroups[i].Rank > sortedTitleGroups[j].Rank {
-				sortedTitleGroups[i], sortedTitleGroups[j] = sortedTitleGroups[j], sortedTitleGroups[i]
-			}
+	// Sort by rank (lower number = higher priority), then by title for a stable order
+	sort.Slice(sortedTitleGroups, func(i, j int) bool {
+		if sortedTitleGroups[i].Rank != sortedTitleGroups[j].Rank {
+			return sortedTitleGroups[i].Rank < sortedTitleGroups[j].Rank
 		}
-	}
+		return sortedTitleGroups[i].Title < sortedTitleGroups[j].Title
+	})
 
 	// Format each title group in ranked order
 	var titleParts []string
@@ -483,8 +802,7 @@ func main() {
 			Arg:      "",
 			Icon:     map[string]string{"path": "icons/hopeless.png"},
 		}}}
-		jsonOut, _ := json.Marshal(errorResult)
-		fmt.Println(string(jsonOut))
+		writeResult(errorResult)
 		return
 	}
 
@@ -501,36 +819,53 @@ func main() {
 		logMsg("Restored query: %s", input)
 	}
 
-	// Connect to SQLite database
-	db, err := sql.Open("sqlite3", config.DBPath)
-	if err != nil {
-		logMsg("Error opening database: %v", err)
+	// Check if we have input for non-ruler modes, before touching the database
+	if config.MySource != "ruler" && input == "" {
+		logMsg("No search input provided")
 		return
 	}
-	defer db.Close()
 
-	// Set pragmas for better performance
-	_, err = db.Exec("PRAGMA case_sensitive_like=OFF")
-	if err != nil {
-		logMsg("Error setting pragma: %v", err)
-		return
+	// The lineage's go-back action returns to the query it was opened from
+	originalQuery := os.Getenv("originalQuery")
+	if originalQuery == "" {
+		originalQuery = input
 	}
 
-	// If mySource == 'ruler' show a list of rulers
+	// Repeated searches (e.g. while backspacing) and revisited lineages are
+	// answered from the cache
+	// searchErr records a failed query (or an empty result), whose output must
+	// not be cached
+	var searchErr error
+	var cacheKey []string
 	if config.MySource == "ruler" {
-		// Get the original query from environment if available
-		originalQueryFromEnv := os.Getenv("originalQuery")
-		if originalQueryFromEnv != "" {
-			byRuler(db, "", "listLineage", config, originalQueryFromEnv)
-		} else {
-			byRuler(db, "", "listLineage", config, input)
+		cacheKey = []string{"lineage", config.MyTitle, config.MyRulerID, config.MyTitleProg, originalQuery}
+	} else {
+		cacheKey = []string{"search", strconv.FormatBool(config.ShowEvents), input}
+	}
+	if cachePath := queryCachePath(config, cacheKey...); cachePath != "" {
+		if serveCached(cachePath) {
+			logMsg("Served from cache in %s", formatDuration(time.Since(startTime)))
+			return
 		}
+		var cached bytes.Buffer
+		output = io.MultiWriter(os.Stdout, &cached)
+		defer func() {
+			cacheResult(cachePath, cached.Bytes(), searchErr)
+		}()
+	}
+
+	// Connect to SQLite database (pragmas are applied per connection by the driver)
+	db, err := sql.Open(sqliteDriver, readOnlyDSN(config.DBPath))
+	if err != nil {
+		logMsg("Error opening database: %v", err)
+		searchErr = err
 		return
 	}
+	defer db.Close()
 
-	// Check if we have input for non-ruler modes
-	if input == "" {
-		logMsg("No search input provided")
+	// If mySource == 'ruler' show a list of rulers
+	if config.MySource == "ruler" {
+		searchErr = byRuler(db, "", "listLineage", config, originalQuery)
 		return
 	}
 
@@ -559,54 +894,57 @@ func main() {
 			}
 		}
 
+		sortTermsByLength(searchTermsWN)
 		logMsg("Matched Term: %s", matchedTerm)
 		logMsg("Remaining terms: %v", searchTermsWN)
 
 		// Search by year
-		byYear(db, searchTermsWN, matchedTerm, config, input)
+		searchErr = byYear(db, searchTermsWN, matchedTerm, config, input)
 	} else {
+		sortTermsByLength(searchTerms)
+
 		// Search by ruler and events
 		if config.ShowEvents {
 			// Search both rulers and events, then combine results
 			result := AlfredResult{Items: []AlfredItem{}}
 
-			// Get ruler results (without individual counters)
-			rulerItems := getRulerResultsWithoutCounters(db, searchTerms, config, input)
-			result.Items = append(result.Items, rulerItems...)
+			// Ruler and event searches are independent, so run them concurrently
+			// (without individual counters)
+			var rulerItems, eventItems []AlfredItem
+			var rulerErr, eventErr error
+			var wg sync.WaitGroup
+			wg.Add(2)
+			go func() {
+				defer wg.Done()
+				rulerItems, rulerErr = getRulerResultsWithoutCounters(db, searchTerms, config, input)
+			}()
+			go func() {
+				defer wg.Done()
+				eventItems, eventErr = byEventWithoutCounters(db, searchTerms, config, input)
+			}()
+			wg.Wait()
+			searchErr = rulerErr
+			if searchErr == nil {
+				searchErr = eventErr
+			}
 
-			// Get event results (without individual counters)
-			eventItems := byEventWithoutCounters(db, searchTerms, config, input)
+			result.Items = append(result.Items, rulerItems...)
 			result.Items = append(result.Items, eventItems...)
 
 			// Add unified counters across all results
-			totalCount := len(result.Items)
-			for i := range result.Items {
-				if result.Items[i].Subtitle != "" {
-					result.Items[i].Subtitle = fmt.Sprintf("%s/%s %s", formatNumber(i+1), formatNumber(totalCount), result.Items[i].Subtitle)
-				} else {
-					result.Items[i].Subtitle = fmt.Sprintf("%s/%s", formatNumber(i+1), formatNumber(totalCount))
-				}
-			}
+			addCounters(result.Items)
 
 			// If no results found, show "No results" message
 			if len(result.Items) == 0 {
+				if searchErr == nil {
+					searchErr = errNoResults
+				}
 				result.Items = append(result.Items, AlfredItem{
 					Title:    "No results here 🫤",
 					Subtitle: "Try a different query",
 					Arg:      "",
 					Mods: map[string]AlfredMod{
-						"cmd+alt": {
-							Valid:    true,
-							Arg:      input,
-							Subtitle: "Go back to main search",
-							Variables: map[string]string{
-								"mySource":      "",
-								"myRulerID":     "",
-								"mytitleProg":   "",
-								"myTitle":       "",
-								"restoredQuery": input,
-							},
-						},
+						"cmd+alt": goBackMod(input),
 					},
 					Icon: map[string]string{
 						"path": "icons/hopeless.png",
@@ -615,15 +953,14 @@ func main() {
 			}
 
 			// Output JSON for Alfred
-			jsonOut, err := json.Marshal(result)
-			if err != nil {
+			if err := writeResult(result); err != nil {
 				logMsg("Error creating JSON output: %v", err)
+				searchErr = err
 				return
 			}
-			fmt.Println(string(jsonOut))
 		} else {
 			// Search by ruler only
-			byRuler(db, searchTerms, "searchRuler", config, input)
+			searchErr = byRuler(db, searchTerms, "searchRuler", config, input)
 		}
 	}
 
@@ -631,25 +968,126 @@ func main() {
 	logMsg("\nScript duration: %s", formatDuration(duration))
 }
 
+// Year patterns are compiled once at startup rather than on every call
+var (
+	numberLikeRe = regexp.MustCompile(`^-?\d*\**$|^-?\d*\**--?\d*\**$`)
+	yearRangeRe  = regexp.MustCompile(`^(-?\d+)-(-?\d+)$|^-?(\d+)$`)
+)
+
+// sortTermsByLength puts longer (more selective) terms first, so the AND of
+// LIKE conditions rejects most rows on its first comparison
+func sortTermsByLength(terms []string) {
+	sort.SliceStable(terms, func(i, j int) bool {
+		return len(terms[i]) > len(terms[j])
+	})
+}
+
 // Check if the term is a number, BC year, or a range
 func isNumberLike(term string) bool {
-	pattern := `^-?\d*\**$|^-?\d*\**--?\d*\**$`
-	matched, err := regexp.MatchString(pattern, term)
-	if err != nil {
-		logMsg("Regexp error: %v", err)
-		return false
-	}
+	matched := numberLikeRe.MatchString(term)
 	if matched {
 		logMsg("Matching term: %s", term)
 	}
 	return matched
 }
 
+// maxRangeYearDigits caps the length of a wildcard year turned into an integer
+// range, keeping the bounds well inside a 32-bit int; longer terms use LIKE
+const maxRangeYearDigits = 9
+
+// yearCondition builds the SQL condition on y.year shared by the ruler and event
+// year searches, together with its bound arguments: a range ("1700-1750",
+// "-50--20") or a year with optional trailing wildcards ("17**")
+func yearCondition(yearTerm string) (string, []interface{}) {
+	dashCount := strings.Count(yearTerm, "-")
+	if dashCount == 1 && !strings.HasPrefix(yearTerm, "-") {
+		// A year range
+		logMsg("Year range")
+		parts := strings.Split(yearTerm, "-")
+		return "(y.year BETWEEN ? AND ?)", []interface{}{parts[0], parts[1]}
+	}
+	if dashCount > 1 {
+		// A year range including a negative
+		start, end := extractRange(yearTerm)
+		logMsg("Start: %s, end: %s", start, end)
+		return "(y.year BETWEEN ? AND ?)", []interface{}{start, end}
+	}
+
+	// A year, with each trailing asterisk matching a single digit
+	asteriskCount := len(yearTerm) - len(strings.TrimRight(yearTerm, "*"))
+	prefix := yearTerm[:len(yearTerm)-asteriskCount]
+	digitCount := len(strings.TrimPrefix(prefix, "-")) + asteriskCount
+	if base, ok := exactYear(prefix); ok && base != 0 && digitCount <= maxRangeYearDigits {
+		// A whole-number prefix covers a contiguous block of years ("17**" is
+		// 1700 to 1799, "-5*" is -59 to -50), so compare integers instead of
+		// converting every year to text
+		span := 1
+		for i := 0; i < asteriskCount; i++ {
+			span *= 10
+		}
+		low, high := base*span, base*span+span-1
+		if base < 0 {
+			low, high = base*span-span+1, base*span
+		}
+		return "(y.year BETWEEN ? AND ?)", []interface{}{low, high}
+	}
+	wildcards := strings.Repeat("_", asteriskCount)
+	return "(CAST(y.year as TEXT) LIKE ?)", []interface{}{prefix + wildcards}
+}
+
+// lineageQuery lists every period held under a title, in progression order
+const lineageQuery = `
+	SELECT 
+		ru.*,
+		per.*,
+		t.title AS title,
+		t.maxCount as titleCount,
+		t.titlePlural as titlePlural
+	FROM
+		rulers ru
+	JOIN 
+		byPeriod per ON ru.rulerID = per.rulerID
+	JOIN 
+		titles t ON per.titleID = t.titleID
+	WHERE
+		t.title = ?
+	ORDER BY per.progrTitle ASC
+	;`
+
+// rulerSearchColumns are the columns a free-text ruler search matches against
+var rulerSearchColumns = []string{"ru.name", "ru.personal_name", "ru.epithet", "ru.notes", "t.title"}
+
+// likeConditions builds an AND of one condition per search term, each matching
+// the term anywhere in any of the given columns, together with the bound
+// arguments. Terms are passed as parameters rather than spliced into the SQL,
+// so quotes in the input cannot break (or inject into) the query.
+func likeConditions(terms []string, columns ...string) (string, []interface{}) {
+	conditions := make([]string, 0, len(terms))
+	args := make([]interface{}, 0, len(terms)*len(columns))
+	for _, s := range terms {
+		matches := make([]string, len(columns))
+		for i, column := range columns {
+			matches[i] = column + " LIKE ?"
+			args = append(args, "%"+s+"%")
+		}
+		conditions = append(conditions, "("+strings.Join(matches, " OR ")+")")
+	}
+	return strings.Join(conditions, " AND "), args
+}
+
+// exactYear reports whether the term is a single plain year (e.g. "1776" or "-44")
+// and returns it as an integer
+func exactYear(term string) (int, bool) {
+	year, err := strconv.Atoi(term)
+	if err != nil || strconv.Itoa(year) != term {
+		return 0, false
+	}
+	return year, true
+}
+
 // Extract start and end years from a range term
 func extractRange(term string) (start, end string) {
-	pattern := `^(-?\d+)-(-?\d+)$|^-?(\d+)$`
-	re := regexp.MustCompile(pattern)
-	matches := re.FindStringSubmatch(term)
+	matches := yearRangeRe.FindStringSubmatch(term)
 
 	logMsg("Extracting range")
 
@@ -675,10 +1113,18 @@ type PeriodInfo struct {
 	ProgrTitle int
 }
 
-// Query for rulers by name or properties
-func byRuler(db *sql.DB, searchStringList interface{}, queryType string, config Config, originalQuery ...string) {
-	var currentProg int // Declare currentProg at function level for listLineage use
+// rulerGroup holds a matched ruler together with all of its matched periods,
+// and the earliest start and latest end year across them
+type rulerGroup struct {
+	Row       RulerRow
+	Periods   []PeriodInfo
+	StartYear int
+	EndYear   int
+}
 
+// Query for rulers by name or properties. It returns the first query or scan
+// error, so the caller knows the output is incomplete and must not be cached.
+func byRuler(db *sql.DB, searchStringList interface{}, queryType string, config Config, originalQuery ...string) error {
 	// Get the original query for storing/restoring
 	var origQuery string
 	if len(originalQuery) > 0 {
@@ -697,76 +1143,51 @@ func byRuler(db *sql.DB, searchStringList interface{}, queryType string, config
 			terms = []string{}
 		}
 
-		// Build the SQL conditions for text search
-		conditions := []string{}
-		for _, s := range terms {
-			condition := fmt.Sprintf(`(ru.name LIKE '%%%s%%' OR 
-				ru.personal_name LIKE '%%%s%%' OR 
-				ru.epithet LIKE '%%%s%%' OR 
-				ru.notes LIKE '%%%s%%' OR 
-				t.title LIKE '%%%s%%')`, s, s, s, s, s)
-			conditions = append(conditions, condition)
-		}
-		textSQLString := strings.Join(conditions, " AND ")
-
-		// TODO: searchRuler functionality needs to be implemented
-		_ = textSQLString
-
-	} else if queryType == "listLineage" {
-		// For listLineage, we need to find the correct progression number for the specific title
-		// First, get the progression number for the current ruler and title
-		myRulerID, _ := strconv.Atoi(config.MyRulerID)
-
-		// Query to get the progression number for this ruler and title
-		progQuery := fmt.Sprintf(`
-			SELECT per.progrTitle
-			FROM byPeriod per
-			JOIN titles t ON per.titleID = t.titleID
-			WHERE per.rulerID = %d AND t.title = '%s'
-			ORDER BY per.progrTitle ASC
-			LIMIT 1`, myRulerID, config.MyTitle)
+		// Same ruler results as the combined search, without the events
+		rulerItems, err := getRulerResultsWithoutCounters(db, terms, config, origQuery)
+		result := AlfredResult{Items: []AlfredItem{}}
+		result.Items = append(result.Items, rulerItems...)
+		addCounters(result.Items)
 
-		err := db.QueryRow(progQuery).Scan(&currentProg)
-		if err != nil {
-			logMsg("Error getting progression number: %v", err)
-			return
+		// If no results found, show "No results" message
+		if len(result.Items) == 0 {
+			if err == nil {
+				err = errNoResults
+			}
+			result.Items = append(result.Items, AlfredItem{
+				Title:    "No results here 🫤",
+				Subtitle: "Try a different query",
+				Arg:      "",
+				Mods: map[string]AlfredMod{
+					"cmd+alt": goBackMod(origQuery),
+				},
+				Icon: map[string]string{
+					"path": "icons/hopeless.png",
+				},
+			})
 		}
 
-		minProg := currentProg - 3
-		if minProg < 1 {
-			minProg = 1
+		// Output JSON for Alfred
+		if err := writeResult(result); err != nil {
+			logMsg("Error creating JSON output: %v", err)
+			return err
 		}
+		return err
 
+	} else if queryType == "listLineage" {
 		// Classic lineage logic: get all periods for the title, ordered by progression
 		result := AlfredResult{Items: []AlfredItem{}}
 
-		query := fmt.Sprintf(`
-			SELECT 
-				ru.*,
-				per.*,
-				t.title AS title,
-				t.maxCount as titleCount,
-				t.titlePlural as titlePlural
-			FROM
-				rulers ru
-			JOIN 
-				byPeriod per ON ru.rulerID = per.rulerID
-			JOIN 
-				titles t ON per.titleID = t.titleID
-			WHERE
-				t.title = '%s'
-			ORDER BY per.progrTitle ASC
-			;`, config.MyTitle)
-
-		rows, err := db.Query(query)
+		rows, err := db.Query(lineageQuery, config.MyTitle)
 		if err != nil {
 			logMsg("Error querying periods: %v", err)
-			return
+			return err
 		}
 		defer rows.Close()
 
 		// Keep all periods by progression order (don't filter by ruler ID)
 		var lineageRows []RulerRow
+		var scanErr error
 		for rows.Next() {
 			var r RulerRow
 			err := rows.Scan(
@@ -776,21 +1197,37 @@ func byRuler(db *sql.DB, searchStringList interface{}, queryType string, config
 			)
 			if err != nil {
 				logMsg("Error scanning row: %v", err)
+				scanErr = err
 				continue
 			}
 			lineageRows = append(lineageRows, r)
 		}
+		if err := rows.Err(); err != nil {
+			logMsg("Error reading periods: %v", err)
+			scanErr = err
+		}
 
-		// Find the index of the current ruler
-		myRulerID, _ = strconv.Atoi(config.MyRulerID)
+		// Find the index of the current ruler. The title's full lineage is already
+		// loaded, so it also tells whether the ruler held the title at all.
+		myRulerID, _ := strconv.Atoi(config.MyRulerID)
 		myProg, _ := strconv.Atoi(config.MyTitleProg)
 		currentIdx := -1
+		heldTitle := false
 		for i, r := range lineageRows {
-			if r.RulerID == myRulerID && r.ProgrTitle == myProg {
+			if r.RulerID != myRulerID {
+				continue
+			}
+			heldTitle = true
+			if r.ProgrTitle == myProg {
 				currentIdx = i
 				break
 			}
 		}
+		if !heldTitle {
+			err := fmt.Errorf("ruler %d has no %s period", myRulerID, config.MyTitle)
+			logMsg("Error getting progression number: %v", err)
+			return err
+		}
 		if currentIdx == -1 {
 			currentIdx = 0 // fallback
 		}
@@ -803,6 +1240,7 @@ func byRuler(db *sql.DB, searchStringList interface{}, queryType string, config
 		// Show all rulers from the current one onward (no upper limit)
 		endIdx := len(lineageRows)
 
+		backMod := goBackMod(origQuery)
 		for i := startIdx; i < endIdx; i++ {
 			r := lineageRows[i]
 			// Mark all occurrences of the same ruler
@@ -835,10 +1273,8 @@ func byRuler(db *sql.DB, searchStringList interface{}, queryType string, config
 			}
 			endYear := strconv.Itoa(r.EndYear)
 			startYear := strconv.Itoa(r.StartYear)
-			iconPath := fmt.Sprintf("icons/%s.png", r.Title)
-			if _, err := os.Stat(iconPath); os.IsNotExist(err) {
-				iconPath = "icons/crown.png"
-			}
+			titlePlural := getTitlePlural(r.TitlePlural, r.Title)
+			iconPath := getIconPath(r.Title)
 			item := AlfredItem{
 				Title:    myTitle,
 				Subtitle: subtitleString,
@@ -863,8 +1299,8 @@ func byRuler(db *sql.DB, searchStringList interface{}, queryType string, config
 					},
 					"alt": {
 						Valid:    true,
-						Arg:      getTitlePlural(r.TitlePlural, r.Title),
-						Subtitle: fmt.Sprintf("Show all %s", getTitlePlural(r.TitlePlural, r.Title)),
+						Arg:      titlePlural,
+						Subtitle: fmt.Sprintf("Show all %s", titlePlural),
 						Variables: map[string]string{
 							"mySource":      "ruler",
 							"myRulerID":     strconv.Itoa(r.RulerID),
@@ -873,18 +1309,7 @@ func byRuler(db *sql.DB, searchStringList interface{}, queryType string, config
 							"originalQuery": origQuery,
 						},
 					},
-					"cmd+alt": {
-						Valid:    true,
-						Arg:      origQuery,
-						Subtitle: "Go back to main search",
-						Variables: map[string]string{
-							"mySource":      "",
-							"myRulerID":     "",
-							"mytitleProg":   "",
-							"myTitle":       "",
-							"restoredQuery": origQuery,
-						},
-					},
+					"cmd+alt": backMod,
 					"shift": {
 						Valid:    true,
 						Arg:      fmt.Sprintf("%s: %s", myTitle, subtitleString),
@@ -899,18 +1324,18 @@ func byRuler(db *sql.DB, searchStringList interface{}, queryType string, config
 		}
 
 		// Output JSON for Alfred
-		jsonOut, err := json.Marshal(result)
-		if err != nil {
+		if err := writeResult(result); err != nil {
 			logMsg("Error creating JSON output: %v", err)
-			return
+			return err
 		}
-		fmt.Println(string(jsonOut))
-		return
+		return scanErr
 	}
+	return nil
 }
 
-// Search rulers by year
-func byYear(db *sql.DB, searchTerms []string, yearTerm string, config Config, originalQuery string) {
+// Search rulers by year. It returns the first query or scan error (from either
+// the ruler or the event query), or errNoResults when nothing matched.
+func byYear(db *sql.DB, searchTerms []string, yearTerm string, config Config, originalQuery string) error {
 	var junctionString string
 	if len(searchTerms) > 0 {
 		junctionString = " AND "
@@ -918,35 +1343,43 @@ func byYear(db *sql.DB, searchTerms []string, yearTerm string, config Config, or
 		junctionString = ""
 	}
 
-	// Process wildcards
-	asteriskCount := len(yearTerm) - len(strings.TrimRight(yearTerm, "*"))
-	prefix := yearTerm[:len(yearTerm)-asteriskCount]
-	wildcards := strings.Repeat("_", asteriskCount)
-
-	var yearSQLString string
-	if strings.Count(yearTerm, "-") == 1 && !strings.HasPrefix(yearTerm, "-") {
-		// A year range
-		logMsg("Year range")
-		parts := strings.Split(yearTerm, "-")
-		yearSQLString = fmt.Sprintf("(y.year BETWEEN '%s' AND '%s')%s", parts[0], parts[1], junctionString)
-	} else if strings.Count(yearTerm, "-") > 1 {
-		// A year range including a negative
-		start, end := extractRange(yearTerm)
-		logMsg("Start: %s, end: %s", start, end)
-		yearSQLString = fmt.Sprintf("(y.year BETWEEN '%s' AND '%s')%s", start, end, junctionString)
-	} else {
-		yearSQLString = fmt.Sprintf("(CAST(y.year as TEXT) LIKE '%s%s')%s", prefix, wildcards, junctionString)
-	}
+	// A wildcard or range term is shown as typed; otherwise each row shows its year
+	showYearTerm := strings.HasSuffix(yearTerm, "*") || strings.Contains(yearTerm, "-")
+	yearSQLString, yearArgs := yearCondition(yearTerm)
+	yearSQLString += junctionString
 
 	// Build text search conditions
-	textConditions := []string{}
-	for _, s := range searchTerms {
-		condition := fmt.Sprintf("((r.name LIKE '%%%s%%') OR (t.title LIKE '%%%s%%'))", s, s)
-		textConditions = append(textConditions, condition)
-	}
-	textSQLString := strings.Join(textConditions, " AND ")
-
-	query := fmt.Sprintf(`
+	textSQLString, textArgs := likeConditions(searchTerms, "r.name", "t.title")
+
+	var query string
+	var args []interface{}
+	if year, ok := exactYear(yearTerm); ok {
+		// A single year: match the periods covering it directly instead of
+		// expanding every period through byYear and grouping it back
+		query = fmt.Sprintf(`
+		SELECT 
+		r.*,
+		per.*,
+		t.title AS title,
+		t.maxCount as titleCount,
+		t.titlePlural as titlePlural,
+		? AS year
+		
+		FROM
+			byPeriod per
+		JOIN 
+			rulers r ON per.rulerID = r.rulerID
+		JOIN 
+			titles t ON per.titleID = t.titleID
+		WHERE
+			(per.startYear <= ? AND per.endYear >= ?)%s
+			%s
+		ORDER BY 
+			per.periodID
+		;`, junctionString, textSQLString)
+		args = []interface{}{year, year, year}
+	} else {
+		query = fmt.Sprintf(`
 		SELECT 
 		r.*,
 		per.*,
@@ -973,20 +1406,39 @@ func byYear(db *sql.DB, searchTerms []string, yearTerm string, config Config, or
 		ORDER BY 
 			y.year
 		;`, yearSQLString, textSQLString)
+		args = yearArgs
+	}
+	args = append(args, textArgs...)
+
+	// Events for the same year do not depend on the ruler query, so fetch them concurrently
+	var eventItems []AlfredItem
+	var eventErr error
+	var wg sync.WaitGroup
+	if config.ShowEvents {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			eventItems, eventErr = getEventsByYearWithoutCounters(db, searchTerms, yearTerm, config, originalQuery)
+		}()
+	}
+	defer wg.Wait()
 
 	queryStart := time.Now()
-	rows, err := db.Query(query)
+	rows, err := db.Query(query, args...)
 	queryDuration := time.Since(queryStart)
 	logMsg("Query executed in %s", formatDuration(queryDuration))
 
 	if err != nil {
 		logMsg("Error querying database: %v", err)
-		return
+		return err
 	}
 	defer rows.Close()
 
-	// Collect all results first to get total count
-	var allRows []RulerRow
+	var scanErr error
+
+	backMod := goBackMod(originalQuery)
+	// Build items directly from the rows; counters are added once events are merged
+	result := AlfredResult{Items: []AlfredItem{}}
 	for rows.Next() {
 		var r RulerRow
 		err := rows.Scan(
@@ -996,20 +1448,12 @@ func byYear(db *sql.DB, searchTerms []string, yearTerm string, config Config, or
 		)
 		if err != nil {
 			logMsg("Error scanning row: %v", err)
+			scanErr = err
 			continue
 		}
-		allRows = append(allRows, r)
-	}
 
-	totalCount := len(allRows)
-	result := AlfredResult{Items: []AlfredItem{}}
-
-	// Process results
-	for _, r := range allRows {
 		var yearString string
-		// Check if the year term contains an asterisk or is a range
-		isRange, _ := regexp.MatchString(`-`, yearTerm)
-		if asteriskCount > 0 || isRange {
+		if showYearTerm {
 			yearString = yearTerm
 		} else {
 			yearString = formatYear(int(r.Year.Int64))
@@ -1038,12 +1482,9 @@ func byYear(db *sql.DB, searchTerms []string, yearTerm string, config Config, or
 
 		endYear := strconv.Itoa(r.EndYear)
 		startYear := strconv.Itoa(r.StartYear)
+		titlePlural := getTitlePlural(r.TitlePlural, r.Title)
 
-		// Check if the icon file exists, use default crown if not
-		iconPath := fmt.Sprintf("icons/%s.png", r.Title)
-		if _, err := os.Stat(iconPath); os.IsNotExist(err) {
-			iconPath = "icons/crown.png"
-		}
+		iconPath := getIconPath(r.Title)
 
 		item := AlfredItem{
 			Title:    myTitle,
@@ -1069,8 +1510,8 @@ func byYear(db *sql.DB, searchTerms []string, yearTerm string, config Config, or
 				},
 				"alt": {
 					Valid:    true,
-					Arg:      getTitlePlural(r.TitlePlural, r.Title),
-					Subtitle: fmt.Sprintf("Show all %s", getTitlePlural(r.TitlePlural, r.Title)),
+					Arg:      titlePlural,
+					Subtitle: fmt.Sprintf("Show all %s", titlePlural),
 					Variables: map[string]string{
 						"mySource":      "ruler",
 						"myRulerID":     strconv.Itoa(r.RulerID),
@@ -1079,19 +1520,8 @@ func byYear(db *sql.DB, searchTerms []string, yearTerm string, config Config, or
 						"originalQuery": originalQuery,
 					},
 				},
-				"cmd+alt": {
-					Valid:    true,
-					Arg:      originalQuery,
-					Subtitle: "Go back to main search",
-					Variables: map[string]string{
-						"mySource":      "",
-						"myRulerID":     "",
-						"mytitleProg":   "",
-						"myTitle":       "",
-						"restoredQuery": originalQuery,
-					},
-				},
-				"shift": {
+				"cmd+alt": backMod,
+				"shift": {
 					Valid:    true,
 					Arg:      fmt.Sprintf("%s: %s", myTitle, subtitleString),
 					Subtitle: "Copy full info to clipboard",
@@ -1105,41 +1535,32 @@ func byYear(db *sql.DB, searchTerms []string, yearTerm string, config Config, or
 		result.Items = append(result.Items, item)
 	}
 
-	// If ShowEvents is enabled, also get events for this year
-	if config.ShowEvents {
-		eventItems := getEventsByYearWithoutCounters(db, searchTerms, yearTerm, config, originalQuery)
-		result.Items = append(result.Items, eventItems...)
+	if err := rows.Err(); err != nil {
+		logMsg("Error reading rows: %v", err)
+		scanErr = err
 	}
 
-	// Add unified counters to all items (rulers + events)
-	totalCount = len(result.Items)
-	for i := range result.Items {
-		if result.Items[i].Subtitle != "" {
-			result.Items[i].Subtitle = fmt.Sprintf("%s/%s %s", formatNumber(i+1), formatNumber(totalCount), result.Items[i].Subtitle)
-		} else {
-			result.Items[i].Subtitle = fmt.Sprintf("%s/%s", formatNumber(i+1), formatNumber(totalCount))
-		}
+	// If ShowEvents is enabled, also add the events for this year
+	wg.Wait()
+	result.Items = append(result.Items, eventItems...)
+	if scanErr == nil {
+		scanErr = eventErr
 	}
 
+	// Add unified counters to all items (rulers + events)
+	addCounters(result.Items)
+
 	// If year term exists but no results found
 	if yearTerm != "" && len(result.Items) == 0 {
+		if scanErr == nil {
+			scanErr = errNoResults
+		}
 		result.Items = append(result.Items, AlfredItem{
 			Title:    "No results here 🫤",
 			Subtitle: "Try a different query",
 			Arg:      "",
 			Mods: map[string]AlfredMod{
-				"cmd+alt": {
-					Valid:    true,
-					Arg:      originalQuery,
-					Subtitle: "Go back to main search",
-					Variables: map[string]string{
-						"mySource":      "",
-						"myRulerID":     "",
-						"mytitleProg":   "",
-						"myTitle":       "",
-						"restoredQuery": originalQuery,
-					},
-				},
+				"cmd+alt": goBackMod(originalQuery),
 			},
 			Icon: map[string]string{
 				"path": "icons/hopeless.png",
@@ -1148,187 +1569,55 @@ func byYear(db *sql.DB, searchTerms []string, yearTerm string, config Config, or
 	}
 
 	// Output JSON for Alfred
-	jsonOut, err := json.Marshal(result)
-	if err != nil {
+	if err := writeResult(result); err != nil {
 		logMsg("Error creating JSON output: %v", err)
-		return
+		return err
 	}
-	fmt.Println(string(jsonOut))
+	return scanErr
 }
 
-// Search events by name
-func byEvent(db *sql.DB, searchTerms []string, config Config, originalQuery string) []AlfredItem {
-	// Build the SQL conditions for text search
-	conditions := []string{}
-	for _, s := range searchTerms {
-		condition := fmt.Sprintf(`(e.eventName LIKE '%%%s%%' OR e.notes LIKE '%%%s%%')`, s, s)
-		conditions = append(conditions, condition)
+// Helper function to get events by year without counters, along with the first
+// query or scan error
+func getEventsByYearWithoutCounters(db *sql.DB, searchTerms []string, yearTerm string, config Config, originalQuery string) ([]AlfredItem, error) {
+	var junctionString string
+	if len(searchTerms) > 0 {
+		junctionString = " AND "
+	} else {
+		junctionString = ""
 	}
-	textSQLString := strings.Join(conditions, " AND ")
 
-	query := fmt.Sprintf(`
+	// A wildcard or range term is shown as typed; otherwise each row shows its year
+	showYearTerm := strings.HasSuffix(yearTerm, "*") || strings.Contains(yearTerm, "-")
+	yearSQLString, yearArgs := yearCondition(yearTerm)
+	yearSQLString += junctionString
+
+	// Build text search conditions for events
+	textSQLString, textArgs := likeConditions(searchTerms, "e.eventName", "e.notes")
+
+	var query string
+	var args []interface{}
+	if year, ok := exactYear(yearTerm); ok {
+		// A single year: match the events spanning it directly, without byYear
+		query = fmt.Sprintf(`
 		SELECT 
 			e.eventID,
 			e.eventName,
 			e.startYear,
 			e.endYear,
 			e.notes,
-			e.wikipedia
+			e.wikipedia,
+			? AS year
 		FROM
 			byEvents e
 		WHERE
+			(e.startYear <= ? AND e.endYear >= ?)%s
 			%s
-		ORDER BY
-			e.startYear;`, textSQLString)
-
-	queryStart := time.Now()
-	rows, err := db.Query(query)
-	queryDuration := time.Since(queryStart)
-	logMsg("Event query executed in %s", formatDuration(queryDuration))
-
-	if err != nil {
-		logMsg("Error querying events: %v", err)
-		return []AlfredItem{}
-	}
-	defer rows.Close()
-
-	// Collect all events first to get total count
-	var allEvents []EventRow
-	for rows.Next() {
-		var e EventRow
-		err := rows.Scan(&e.EventID, &e.EventName, &e.StartYear, &e.EndYear, &e.Notes, &e.Wikipedia)
-		if err != nil {
-			logMsg("Error scanning event row: %v", err)
-			continue
-		}
-		allEvents = append(allEvents, e)
-	}
-
-	totalCount := len(allEvents)
-	var eventItems []AlfredItem
-
-	// Process each event with counter
-	for i, e := range allEvents {
-		// Format the event title and subtitle
-		var yearString string
-		if e.StartYear == e.EndYear {
-			yearString = formatYear(e.StartYear)
-		} else {
-			yearString = fmt.Sprintf("%s-%s", formatYear(e.StartYear), formatYear(e.EndYear))
-		}
-
-		myTitle := fmt.Sprintf("%s: %s", yearString, e.EventName)
-
-		subtitleString := ""
-		if e.Notes.Valid && e.Notes.String != "" {
-			subtitleString = e.Notes.String
-		}
-
-		// Add counter to subtitle
-		if subtitleString != "" {
-			subtitleString = fmt.Sprintf("%s/%s %s", formatNumber(i+1), formatNumber(totalCount), subtitleString)
-		} else {
-			subtitleString = fmt.Sprintf("%s/%s", formatNumber(i+1), formatNumber(totalCount))
-		}
-
-		// Use the wikipedia link from database if available, otherwise create a basic search URL
-		wikilink := e.EventName
-		if e.Wikipedia.Valid && e.Wikipedia.String != "" {
-			wikilink = e.Wikipedia.String
-		} else {
-			wikilink = fmt.Sprintf("https://en.wikipedia.org/wiki/%s", e.EventName)
-		}
-
-		endYear := strconv.Itoa(e.EndYear)
-		startYear := strconv.Itoa(e.StartYear)
-
-		item := AlfredItem{
-			Title:    myTitle,
-			Subtitle: subtitleString,
-			Valid:    true,
-			Arg:      wikilink,
-			Mods: map[string]AlfredMod{
-				"cmd": {
-					Valid:    true,
-					Arg:      endYear,
-					Subtitle: fmt.Sprintf("travel to %s", endYear),
-					Variables: map[string]string{
-						"mySource": "",
-					},
-				},
-				"ctrl": {
-					Valid:    true,
-					Arg:      startYear,
-					Subtitle: fmt.Sprintf("travel to %s", startYear),
-					Variables: map[string]string{
-						"mySource": "",
-					},
-				},
-				"cmd+alt": {
-					Valid:    true,
-					Arg:      originalQuery,
-					Subtitle: "Go back to main search",
-					Variables: map[string]string{
-						"mySource":      "",
-						"myRulerID":     "",
-						"mytitleProg":   "",
-						"myTitle":       "",
-						"restoredQuery": originalQuery,
-					},
-				},
-				"shift": {
-					Valid:    true,
-					Arg:      fmt.Sprintf("%s: %s", myTitle, subtitleString),
-					Subtitle: "Copy full info to clipboard",
-				},
-			},
-			Icon: map[string]string{
-				"path": "icons/event.png",
-			},
-		}
-
-		eventItems = append(eventItems, item)
-	}
-
-	return eventItems
-}
-
-// Helper function to get events by year without counters
-func getEventsByYearWithoutCounters(db *sql.DB, searchTerms []string, yearTerm string, config Config, originalQuery string) []AlfredItem {
-	var junctionString string
-	if len(searchTerms) > 0 {
-		junctionString = " AND "
-	} else {
-		junctionString = ""
-	}
-
-	// Process wildcards
-	asteriskCount := len(yearTerm) - len(strings.TrimRight(yearTerm, "*"))
-	prefix := yearTerm[:len(yearTerm)-asteriskCount]
-	wildcards := strings.Repeat("_", asteriskCount)
-
-	var yearSQLString string
-	if strings.Count(yearTerm, "-") == 1 && !strings.HasPrefix(yearTerm, "-") {
-		// A year range
-		parts := strings.Split(yearTerm, "-")
-		yearSQLString = fmt.Sprintf("(y.year BETWEEN '%s' AND '%s')%s", parts[0], parts[1], junctionString)
-	} else if strings.Count(yearTerm, "-") > 1 {
-		// A year range including a negative
-		start, end := extractRange(yearTerm)
-		yearSQLString = fmt.Sprintf("(y.year BETWEEN '%s' AND '%s')%s", start, end, junctionString)
+		ORDER BY 
+			e.eventID
+		;`, junctionString, textSQLString)
+		args = []interface{}{year, year, year}
 	} else {
-		yearSQLString = fmt.Sprintf("(CAST(y.year as TEXT) LIKE '%s%s')%s", prefix, wildcards, junctionString)
-	}
-
-	// Build text search conditions for events
-	textConditions := []string{}
-	for _, s := range searchTerms {
-		condition := fmt.Sprintf("(e.eventName LIKE '%%%s%%' OR e.notes LIKE '%%%s%%')", s, s)
-		textConditions = append(textConditions, condition)
-	}
-	textSQLString := strings.Join(textConditions, " AND ")
-
-	query := fmt.Sprintf(`
+		query = fmt.Sprintf(`
 		SELECT 
 			e.eventID,
 			e.eventName,
@@ -1349,18 +1638,24 @@ func getEventsByYearWithoutCounters(db *sql.DB, searchTerms []string, yearTerm s
 		ORDER BY 
 			y.year
 		;`, yearSQLString, textSQLString)
+		args = yearArgs
+	}
+	args = append(args, textArgs...)
 
 	queryStart := time.Now()
-	rows, err := db.Query(query)
+	rows, err := db.Query(query, args...)
 	queryDuration := time.Since(queryStart)
 	logMsg("Event by year query executed in %s", formatDuration(queryDuration))
 
 	if err != nil {
 		logMsg("Error querying events by year: %v", err)
-		return []AlfredItem{}
+		return []AlfredItem{}, err
 	}
 	defer rows.Close()
 
+	var scanErr error
+
+	backMod := goBackMod(originalQuery)
 	var eventItems []AlfredItem
 
 	for rows.Next() {
@@ -1368,14 +1663,13 @@ func getEventsByYearWithoutCounters(db *sql.DB, searchTerms []string, yearTerm s
 		err := rows.Scan(&e.EventID, &e.EventName, &e.StartYear, &e.EndYear, &e.Notes, &e.Wikipedia, &e.Year)
 		if err != nil {
 			logMsg("Error scanning event row: %v", err)
+			scanErr = err
 			continue
 		}
 
 		// Format the event title
 		var yearString string
-		// Check if the year term contains an asterisk or is a range
-		isRange, _ := regexp.MatchString(`-`, yearTerm)
-		if asteriskCount > 0 || isRange {
+		if showYearTerm {
 			yearString = yearTerm
 		} else {
 			yearString = formatYear(int(e.Year.Int64))
@@ -1428,18 +1722,7 @@ func getEventsByYearWithoutCounters(db *sql.DB, searchTerms []string, yearTerm s
 						"mySource": "",
 					},
 				},
-				"cmd+alt": {
-					Valid:    true,
-					Arg:      originalQuery,
-					Subtitle: "Go back to main search",
-					Variables: map[string]string{
-						"mySource":      "",
-						"myRulerID":     "",
-						"mytitleProg":   "",
-						"myTitle":       "",
-						"restoredQuery": originalQuery,
-					},
-				},
+				"cmd+alt": backMod,
 				"shift": {
 					Valid:    true,
 					Arg:      fmt.Sprintf("%s: %s", myTitle, subtitleString),
@@ -1453,23 +1736,19 @@ func getEventsByYearWithoutCounters(db *sql.DB, searchTerms []string, yearTerm s
 
 		eventItems = append(eventItems, item)
 	}
+	if err := rows.Err(); err != nil {
+		logMsg("Error reading event rows: %v", err)
+		scanErr = err
+	}
 
-	return eventItems
+	return eventItems, scanErr
 }
 
-// Helper function to get ruler results without printing
-func getRulerResults(db *sql.DB, searchTerms []string, config Config, originalQuery string) []AlfredItem {
+// Helper function to get ruler results without counters, along with the first
+// query or scan error
+func getRulerResultsWithoutCounters(db *sql.DB, searchTerms []string, config Config, originalQuery string) ([]AlfredItem, error) {
 	// Build the SQL conditions for text search
-	conditions := []string{}
-	for _, s := range searchTerms {
-		condition := fmt.Sprintf(`(ru.name LIKE '%%%s%%' OR 
-			ru.personal_name LIKE '%%%s%%' OR 
-			ru.epithet LIKE '%%%s%%' OR 
-			ru.notes LIKE '%%%s%%' OR 
-			t.title LIKE '%%%s%%')`, s, s, s, s, s)
-		conditions = append(conditions, condition)
-	}
-	textSQLString := strings.Join(conditions, " AND ")
+	textSQLString, args := likeConditions(searchTerms, rulerSearchColumns...)
 
 	query := fmt.Sprintf(`
 		SELECT 
@@ -1489,19 +1768,22 @@ func getRulerResults(db *sql.DB, searchTerms []string, config Config, originalQu
 			ru.rulerID, per.startYear;`, textSQLString)
 
 	queryStart := time.Now()
-	rows, err := db.Query(query)
+	rows, err := db.Query(query, args...)
 	queryDuration := time.Since(queryStart)
 	logMsg("Ruler query executed in %s", formatDuration(queryDuration))
 
 	if err != nil {
 		logMsg("Error querying database: %v", err)
-		return []AlfredItem{}
+		return []AlfredItem{}, err
 	}
 	defer rows.Close()
 
+	var scanErr error
+
 	// Group periods by ruler
-	rulerPeriods := make(map[int][]PeriodInfo)
-	rulerData := make(map[int]RulerRow)
+	rulers := make(map[int]*rulerGroup)
+	// Plurals of every matched title, so no per-ruler lookup query is needed
+	titlePlurals := make(map[string]sql.NullString)
 
 	for rows.Next() {
 		var r RulerRow
@@ -1512,12 +1794,10 @@ func getRulerResults(db *sql.DB, searchTerms []string, config Config, originalQu
 		)
 		if err != nil {
 			logMsg("Error scanning row: %v", err)
+			scanErr = err
 			continue
 		}
 
-		// Store ruler data
-		rulerData[r.RulerID] = r
-
 		// Collect period info
 		period := PeriodInfo{
 			Period:     r.Period,
@@ -1530,223 +1810,34 @@ func getRulerResults(db *sql.DB, searchTerms []string, config Config, originalQu
 		if r.Notes.Valid {
 			period.Notes = r.Notes.String
 		}
-
-		rulerPeriods[r.RulerID] = append(rulerPeriods[r.RulerID], period)
-	}
-
-	var rulerItems []AlfredItem
-
-	// Process each ruler
-	for rulerID, periods := range rulerPeriods {
-		r := rulerData[rulerID]
-
-		// Calculate display strings
-		epithetString := ""
-		if r.Epithet.Valid && r.Epithet.String != "" {
-			epithetString = fmt.Sprintf(" (%s)", r.Epithet.String)
+		// Store ruler data and its period under a single map lookup
+		group, ok := rulers[r.RulerID]
+		if !ok {
+			group = &rulerGroup{StartYear: r.StartYear, EndYear: r.EndYear}
+			rulers[r.RulerID] = group
 		}
-
-		myTitle := fmt.Sprintf("%s%s", r.Name, epithetString)
-
-		// Use biography if available, otherwise format subtitle from periods
-		var subtitleString string
-		if r.Biography.Valid && r.Biography.String != "" {
-			subtitleString = r.Biography.String
-		} else {
-			subtitleString = formatSubtitle(periods, r.PersonalName)
-		}
-
-		wikilink := r.Name
-		if r.Wikipedia.Valid && r.Wikipedia.String != "" {
-			wikilink = r.Wikipedia.String
-		} else {
-			wikilink = fmt.Sprintf("https://en.wikipedia.org/wiki/%s", r.Name)
-		}
-
-		// Determine the earliest start year and latest end year across all periods
-		earliestStart := periods[0].StartYear
-		latestEnd := periods[0].EndYear
-		for _, p := range periods {
-			if p.StartYear < earliestStart {
-				earliestStart = p.StartYear
-			}
-			if p.EndYear > latestEnd {
-				latestEnd = p.EndYear
-			}
-		}
-		firstPeriod := periods[0]
-		startYear := strconv.Itoa(earliestStart)
-		endYear := strconv.Itoa(latestEnd)
-		// Use the highest-ranked title for the icon
-		highestRankedTitle := getHighestRankedTitle(periods)
-		iconPath := fmt.Sprintf("icons/%s.png", highestRankedTitle)
-		if _, err := os.Stat(iconPath); os.IsNotExist(err) {
-			iconPath = "icons/crown.png"
-		}
-
-		item := AlfredItem{
-			Title:    myTitle,
-			Subtitle: subtitleString,
-			Valid:    true,
-			Arg:      wikilink,
-			Mods: map[string]AlfredMod{
-				"cmd": {
-					Valid:    true,
-					Arg:      endYear,
-					Subtitle: fmt.Sprintf("travel to %s", endYear),
-					Variables: map[string]string{
-						"mySource": "",
-					},
-				},
-				"ctrl": {
-					Valid:    true,
-					Arg:      startYear,
-					Subtitle: fmt.Sprintf("travel to %s", startYear),
-					Variables: map[string]string{
-						"mySource": "",
-					},
-				},
-				"alt": {
-					Valid:    true,
-					Arg:      getTitlePlural(r.TitlePlural, r.Title),
-					Subtitle: fmt.Sprintf("Show all %s", getTitlePlural(r.TitlePlural, r.Title)),
-					Variables: map[string]string{
-						"mySource":      "ruler",
-						"myRulerID":     strconv.Itoa(r.RulerID),
-						"mytitleProg":   strconv.Itoa(firstPeriod.ProgrTitle),
-						"myTitle":       highestRankedTitle,
-						"originalQuery": originalQuery,
-					},
-				},
-				"cmd+alt": {
-					Valid:    true,
-					Arg:      originalQuery,
-					Subtitle: "Go back to main search",
-					Variables: map[string]string{
-						"mySource":      "",
-						"myRulerID":     "",
-						"mytitleProg":   "",
-						"myTitle":       "",
-						"restoredQuery": originalQuery,
-					},
-				},
-				"shift": {
-					Valid:    true,
-					Arg:      fmt.Sprintf("%s: %s", myTitle, subtitleString),
-					Subtitle: "Copy full info to clipboard",
-				},
-			},
-			Icon: map[string]string{
-				"path": iconPath,
-			},
+		if r.StartYear < group.StartYear {
+			group.StartYear = r.StartYear
 		}
-
-		rulerItems = append(rulerItems, item)
-	}
-
-	// Add counters to all ruler items
-	totalCount := len(rulerItems)
-	for i := range rulerItems {
-		if rulerItems[i].Subtitle != "" {
-			rulerItems[i].Subtitle = fmt.Sprintf("%s/%s %s", formatNumber(i+1), formatNumber(totalCount), rulerItems[i].Subtitle)
-		} else {
-			rulerItems[i].Subtitle = fmt.Sprintf("%s/%s", formatNumber(i+1), formatNumber(totalCount))
+		if r.EndYear > group.EndYear {
+			group.EndYear = r.EndYear
 		}
+		group.Row = r
+		group.Periods = append(group.Periods, period)
+		titlePlurals[r.Title] = r.TitlePlural
 	}
-
-	return rulerItems
-}
-
-// Helper function to get ruler results without counters
-func getRulerResultsWithoutCounters(db *sql.DB, searchTerms []string, config Config, originalQuery string) []AlfredItem {
-	// Build the SQL conditions for text search
-	conditions := []string{}
-	for _, s := range searchTerms {
-		condition := fmt.Sprintf(`(ru.name LIKE '%%%s%%' OR 
-			ru.personal_name LIKE '%%%s%%' OR 
-			ru.epithet LIKE '%%%s%%' OR 
-			ru.notes LIKE '%%%s%%' OR 
-			t.title LIKE '%%%s%%')`, s, s, s, s, s)
-		conditions = append(conditions, condition)
-	}
-	textSQLString := strings.Join(conditions, " AND ")
-
-	query := fmt.Sprintf(`
-		SELECT 
-			ru.*,
-			per.*,
-			t.title AS title,
-			t.titlePlural as titlePlural
-		FROM
-			rulers ru
-		JOIN 
-			byPeriod per ON ru.rulerID = per.rulerID
-		JOIN 
-			titles t ON per.titleID = t.titleID
-		WHERE
-			%s
-		ORDER BY
-			ru.rulerID, per.startYear;`, textSQLString)
-
-	queryStart := time.Now()
-	rows, err := db.Query(query)
-	queryDuration := time.Since(queryStart)
-	logMsg("Ruler query executed in %s", formatDuration(queryDuration))
-
-	if err != nil {
-		logMsg("Error querying database: %v", err)
-		return []AlfredItem{}
-	}
-	defer rows.Close()
-
-	// Group periods by ruler
-	rulerPeriods := make(map[int][]PeriodInfo)
-	rulerData := make(map[int]RulerRow)
-	// Collect all biographies for each ruler
-	rulerBios := make(map[int]string)
-
-	for rows.Next() {
-		var r RulerRow
-		err := rows.Scan(
-			&r.RulerID, &r.Name, &r.PersonalName, &r.Epithet, &r.Wikipedia, &r.Notes, &r.Biography,
-			&r.PeriodID, &r.RulerID, &r.TitleID, &r.ProgrTitle, &r.Period, &r.StartYear, &r.EndYear, &r.Notes,
-			&r.Title, &r.TitlePlural,
-		)
-		if err != nil {
-			logMsg("Error scanning row: %v", err)
-			continue
-		}
-
-		// Store ruler data
-		rulerData[r.RulerID] = r
-
-		// Collect period info
-		period := PeriodInfo{
-			Period:     r.Period,
-			Notes:      "",
-			Title:      r.Title,
-			StartYear:  r.StartYear,
-			EndYear:    r.EndYear,
-			ProgrTitle: r.ProgrTitle,
-		}
-		if r.Notes.Valid {
-			period.Notes = r.Notes.String
-		}
-		rulerPeriods[r.RulerID] = append(rulerPeriods[r.RulerID], period)
-
-		// Collect the longest biography
-		if r.Biography.Valid && r.Biography.String != "" {
-			if len(r.Biography.String) > len(rulerBios[r.RulerID]) {
-				rulerBios[r.RulerID] = r.Biography.String
-			}
-		}
+	if err := rows.Err(); err != nil {
+		logMsg("Error reading rows: %v", err)
+		scanErr = err
 	}
 
+	backMod := goBackMod(originalQuery)
 	var rulerItems []AlfredItem
 
 	// Process each ruler
-	for rulerID, periods := range rulerPeriods {
-		r := rulerData[rulerID]
+	for _, group := range rulers {
+		r := group.Row
+		periods := group.Periods
 
 		// Calculate display strings
 		epithetString := ""
@@ -1771,40 +1862,15 @@ func getRulerResultsWithoutCounters(db *sql.DB, searchTerms []string, config Con
 			wikilink = fmt.Sprintf("https://en.wikipedia.org/wiki/%s", r.Name)
 		}
 
-		// Determine the earliest start year and latest end year across all periods
-		earliestStart := periods[0].StartYear
-		latestEnd := periods[0].EndYear
-		for _, p := range periods {
-			if p.StartYear < earliestStart {
-				earliestStart = p.StartYear
-			}
-			if p.EndYear > latestEnd {
-				latestEnd = p.EndYear
-			}
-		}
 		firstPeriod := periods[0]
-		startYear := strconv.Itoa(earliestStart)
-		endYear := strconv.Itoa(latestEnd)
+		startYear := strconv.Itoa(group.StartYear)
+		endYear := strconv.Itoa(group.EndYear)
 		// Use the highest-ranked title for the icon
 		highestRankedTitle := getHighestRankedTitle(periods)
-		iconPath := fmt.Sprintf("icons/%s.png", highestRankedTitle)
-		if _, err := os.Stat(iconPath); os.IsNotExist(err) {
-			iconPath = "icons/crown.png"
-		}
+		iconPath := getIconPath(highestRankedTitle)
 
 		// Get the correct TitlePlural for the highest-ranked title
-		pluralQuery := fmt.Sprintf(`
-			SELECT titlePlural
-			FROM titles
-			WHERE title = '%s'
-			LIMIT 1`, highestRankedTitle)
-
-		var correctTitlePlural sql.NullString
-		err = db.QueryRow(pluralQuery).Scan(&correctTitlePlural)
-		if err != nil {
-			logMsg("Error getting title plural: %v", err)
-			return []AlfredItem{}
-		}
+		titlePlural := getTitlePlural(titlePlurals[highestRankedTitle], highestRankedTitle)
 
 		item := AlfredItem{
 			Title:    myTitle,
@@ -1830,8 +1896,8 @@ func getRulerResultsWithoutCounters(db *sql.DB, searchTerms []string, config Con
 				},
 				"alt": {
 					Valid:    true,
-					Arg:      getTitlePlural(correctTitlePlural, highestRankedTitle),
-					Subtitle: fmt.Sprintf("Show all %s", getTitlePlural(correctTitlePlural, highestRankedTitle)),
+					Arg:      titlePlural,
+					Subtitle: fmt.Sprintf("Show all %s", titlePlural),
 					Variables: map[string]string{
 						"mySource":      "ruler",
 						"myRulerID":     strconv.Itoa(r.RulerID),
@@ -1840,18 +1906,7 @@ func getRulerResultsWithoutCounters(db *sql.DB, searchTerms []string, config Con
 						"originalQuery": originalQuery,
 					},
 				},
-				"cmd+alt": {
-					Valid:    true,
-					Arg:      originalQuery,
-					Subtitle: "Go back to main search",
-					Variables: map[string]string{
-						"mySource":      "",
-						"myRulerID":     "",
-						"mytitleProg":   "",
-						"myTitle":       "",
-						"restoredQuery": originalQuery,
-					},
-				},
+				"cmd+alt": backMod,
 				"shift": {
 					Valid:    true,
 					Arg:      fmt.Sprintf("%s: %s", myTitle, subtitleString),
@@ -1867,18 +1922,14 @@ func getRulerResultsWithoutCounters(db *sql.DB, searchTerms []string, config Con
 	}
 
 	// No counters added here - they will be added by the caller
-	return rulerItems
+	return rulerItems, scanErr
 }
 
-// Helper function to get event results without counters
-func byEventWithoutCounters(db *sql.DB, searchTerms []string, config Config, originalQuery string) []AlfredItem {
+// Helper function to get event results without counters, along with the first
+// query or scan error
+func byEventWithoutCounters(db *sql.DB, searchTerms []string, config Config, originalQuery string) ([]AlfredItem, error) {
 	// Build the SQL conditions for text search
-	conditions := []string{}
-	for _, s := range searchTerms {
-		condition := fmt.Sprintf(`(e.eventName LIKE '%%%s%%' OR e.notes LIKE '%%%s%%')`, s, s)
-		conditions = append(conditions, condition)
-	}
-	textSQLString := strings.Join(conditions, " AND ")
+	textSQLString, args := likeConditions(searchTerms, "e.eventName", "e.notes")
 
 	query := fmt.Sprintf(`
 		SELECT 
@@ -1896,16 +1947,19 @@ func byEventWithoutCounters(db *sql.DB, searchTerms []string, config Config, ori
 			e.startYear;`, textSQLString)
 
 	queryStart := time.Now()
-	rows, err := db.Query(query)
+	rows, err := db.Query(query, args...)
 	queryDuration := time.Since(queryStart)
 	logMsg("Event query executed in %s", formatDuration(queryDuration))
 
 	if err != nil {
 		logMsg("Error querying events: %v", err)
-		return []AlfredItem{}
+		return []AlfredItem{}, err
 	}
 	defer rows.Close()
 
+	var scanErr error
+
+	backMod := goBackMod(originalQuery)
 	var eventItems []AlfredItem
 
 	for rows.Next() {
@@ -1913,6 +1967,7 @@ func byEventWithoutCounters(db *sql.DB, searchTerms []string, config Config, ori
 		err := rows.Scan(&e.EventID, &e.EventName, &e.StartYear, &e.EndYear, &e.Notes, &e.Wikipedia)
 		if err != nil {
 			logMsg("Error scanning event row: %v", err)
+			scanErr = err
 			continue
 		}
 
@@ -1966,18 +2021,7 @@ func byEventWithoutCounters(db *sql.DB, searchTerms []string, config Config, ori
 						"mySource": "",
 					},
 				},
-				"cmd+alt": {
-					Valid:    true,
-					Arg:      originalQuery,
-					Subtitle: "Go back to main search",
-					Variables: map[string]string{
-						"mySource":      "",
-						"myRulerID":     "",
-						"mytitleProg":   "",
-						"myTitle":       "",
-						"restoredQuery": originalQuery,
-					},
-				},
+				"cmd+alt": backMod,
 				"shift": {
 					Valid:    true,
 					Arg:      fmt.Sprintf("%s: %s", myTitle, subtitleString),
@@ -1991,182 +2035,10 @@ func byEventWithoutCounters(db *sql.DB, searchTerms []string, config Config, ori
 
 		eventItems = append(eventItems, item)
 	}
-
-	return eventItems
-}
-
-// Helper function to get events by year
-func getEventsByYear(db *sql.DB, searchTerms []string, yearTerm string, config Config, originalQuery string) []AlfredItem {
-	var junctionString string
-	if len(searchTerms) > 0 {
-		junctionString = " AND "
-	} else {
-		junctionString = ""
-	}
-
-	// Process wildcards
-	asteriskCount := len(yearTerm) - len(strings.TrimRight(yearTerm, "*"))
-	prefix := yearTerm[:len(yearTerm)-asteriskCount]
-	wildcards := strings.Repeat("_", asteriskCount)
-
-	var yearSQLString string
-	if strings.Count(yearTerm, "-") == 1 && !strings.HasPrefix(yearTerm, "-") {
-		// A year range
-		parts := strings.Split(yearTerm, "-")
-		yearSQLString = fmt.Sprintf("(y.year BETWEEN '%s' AND '%s')%s", parts[0], parts[1], junctionString)
-	} else if strings.Count(yearTerm, "-") > 1 {
-		// A year range including a negative
-		start, end := extractRange(yearTerm)
-		yearSQLString = fmt.Sprintf("(y.year BETWEEN '%s' AND '%s')%s", start, end, junctionString)
-	} else {
-		yearSQLString = fmt.Sprintf("(CAST(y.year as TEXT) LIKE '%s%s')%s", prefix, wildcards, junctionString)
-	}
-
-	// Build text search conditions for events
-	textConditions := []string{}
-	for _, s := range searchTerms {
-		condition := fmt.Sprintf("(e.eventName LIKE '%%%s%%' OR e.notes LIKE '%%%s%%')", s, s)
-		textConditions = append(textConditions, condition)
-	}
-	textSQLString := strings.Join(textConditions, " AND ")
-
-	query := fmt.Sprintf(`
-		SELECT 
-			e.eventID,
-			e.eventName,
-			e.startYear,
-			e.endYear,
-			e.notes,
-			e.wikipedia,
-			y.year AS year
-		FROM
-			byYear rt
-		JOIN 
-			byEvents e ON rt.eventID = e.eventID
-		JOIN
-			years y ON rt.yearID = y.yearID
-		WHERE
-			%s
-			%s
-		ORDER BY 
-			y.year
-		;`, yearSQLString, textSQLString)
-
-	queryStart := time.Now()
-	rows, err := db.Query(query)
-	queryDuration := time.Since(queryStart)
-	logMsg("Event by year query executed in %s", formatDuration(queryDuration))
-
-	if err != nil {
-		logMsg("Error querying events by year: %v", err)
-		return []AlfredItem{}
-	}
-	defer rows.Close()
-
-	// Collect all events first to get total count
-	var allEvents []EventRow
-	for rows.Next() {
-		var e EventRow
-		err := rows.Scan(&e.EventID, &e.EventName, &e.StartYear, &e.EndYear, &e.Notes, &e.Wikipedia, &e.Year)
-		if err != nil {
-			logMsg("Error scanning event row: %v", err)
-			continue
-		}
-		allEvents = append(allEvents, e)
-	}
-
-	totalCount := len(allEvents)
-	var eventItems []AlfredItem
-
-	// Process each event with counter
-	for i, e := range allEvents {
-		// Format the event title
-		var yearString string
-		// Check if the year term contains an asterisk or is a range
-		isRange, _ := regexp.MatchString(`-`, yearTerm)
-		if asteriskCount > 0 || isRange {
-			yearString = yearTerm
-		} else {
-			yearString = formatYear(int(e.Year.Int64))
-		}
-
-		// Build period range string only if the event spans multiple years
-		var rangeStr string
-		if e.StartYear != e.EndYear {
-			rangeStr = fmt.Sprintf(" (%s-%s)", formatYear(e.StartYear), formatYear(e.EndYear))
-		}
-		myTitle := fmt.Sprintf("%s: %s%s", yearString, e.EventName, rangeStr)
-
-		subtitleString := ""
-		if e.Notes.Valid && e.Notes.String != "" {
-			subtitleString = e.Notes.String
-		}
-
-		// Add counter to subtitle
-		if subtitleString != "" {
-			subtitleString = fmt.Sprintf("%s/%s %s", formatNumber(i+1), formatNumber(totalCount), subtitleString)
-		} else {
-			subtitleString = fmt.Sprintf("%s/%s", formatNumber(i+1), formatNumber(totalCount))
-		}
-
-		// Use the wikipedia link from database if available, otherwise create a basic search URL
-		wikilink := e.EventName
-		if e.Wikipedia.Valid && e.Wikipedia.String != "" {
-			wikilink = e.Wikipedia.String
-		} else {
-			wikilink = fmt.Sprintf("https://en.wikipedia.org/wiki/%s", e.EventName)
-		}
-
-		endYear := strconv.Itoa(e.EndYear)
-		startYear := strconv.Itoa(e.StartYear)
-
-		item := AlfredItem{
-			Title:    myTitle,
-			Subtitle: subtitleString,
-			Valid:    true,
-			Arg:      wikilink,
-			Mods: map[string]AlfredMod{
-				"cmd": {
-					Valid:    true,
-					Arg:      endYear,
-					Subtitle: fmt.Sprintf("travel to %s", endYear),
-					Variables: map[string]string{
-						"mySource": "",
-					},
-				},
-				"ctrl": {
-					Valid:    true,
-					Arg:      startYear,
-					Subtitle: fmt.Sprintf("travel to %s", startYear),
-					Variables: map[string]string{
-						"mySource": "",
-					},
-				},
-				"cmd+alt": {
-					Valid:    true,
-					Arg:      originalQuery,
-					Subtitle: "Go back to main search",
-					Variables: map[string]string{
-						"mySource":      "",
-						"myRulerID":     "",
-						"mytitleProg":   "",
-						"myTitle":       "",
-						"restoredQuery": originalQuery,
-					},
-				},
-				"shift": {
-					Valid:    true,
-					Arg:      fmt.Sprintf("%s: %s", myTitle, subtitleString),
-					Subtitle: "Copy full info to clipboard",
-				},
-			},
-			Icon: map[string]string{
-				"path": "icons/event.png",
-			},
-		}
-
-		eventItems = append(eventItems, item)
+	if err := rows.Err(); err != nil {
+		logMsg("Error reading event rows: %v", err)
+		scanErr = err
 	}
 
-	return eventItems
+	return eventItems, scanErr
 }
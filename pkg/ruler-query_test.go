@@ -0,0 +1,259 @@
+package main
+
+import (
+	"errors"
+	"fmt"
+	"os"
+	"path/filepath"
+	"reflect"
+	"testing"
+	"time"
+)
+
+func TestYearCondition(t *testing.T) {
+	tests := []struct {
+		term     string
+		wantSQL  string
+		wantArgs []interface{}
+	}{
+		{"17**", "(y.year BETWEEN ? AND ?)", []interface{}{1700, 1799}},
+		{"-5*", "(y.year BETWEEN ? AND ?)", []interface{}{-59, -50}},
+		{"0*", "(CAST(y.year as TEXT) LIKE ?)", []interface{}{"0_"}},
+		{"1700-1750", "(y.year BETWEEN ? AND ?)", []interface{}{"1700", "1750"}},
+		{"-50--20", "(y.year BETWEEN ? AND ?)", []interface{}{"-50", "-20"}},
+		{"99999999999*********", "(CAST(y.year as TEXT) LIKE ?)", []interface{}{"99999999999_________"}},
+	}
+	for _, tt := range tests {
+		gotSQL, gotArgs := yearCondition(tt.term)
+		if gotSQL != tt.wantSQL || !reflect.DeepEqual(gotArgs, tt.wantArgs) {
+			t.Errorf("yearCondition(%q) = %q, %v; want %q, %v", tt.term, gotSQL, gotArgs, tt.wantSQL, tt.wantArgs)
+		}
+	}
+}
+
+func TestExactYear(t *testing.T) {
+	tests := []struct {
+		term   string
+		want   int
+		wantOK bool
+	}{
+		{"1776", 1776, true},
+		{"-44", -44, true},
+		{"0", 0, true},
+		{"007", 0, false},
+		{"-0", 0, false},
+		{"+5", 0, false},
+		{"17**", 0, false},
+	}
+	for _, tt := range tests {
+		got, ok := exactYear(tt.term)
+		if got != tt.want || ok != tt.wantOK {
+			t.Errorf("exactYear(%q) = %d, %v; want %d, %v", tt.term, got, ok, tt.want, tt.wantOK)
+		}
+	}
+}
+
+func TestLikeConditions(t *testing.T) {
+	tests := []struct {
+		terms    []string
+		columns  []string
+		wantSQL  string
+		wantArgs []interface{}
+	}{
+		{
+			[]string{`o'brien"; drop table rulers; --`},
+			[]string{"r.name", "t.title"},
+			"(r.name LIKE ? OR t.title LIKE ?)",
+			[]interface{}{`%o'brien"; drop table rulers; --%`, `%o'brien"; drop table rulers; --%`},
+		},
+		{
+			[]string{"louis", "xiv"},
+			[]string{"e.eventName"},
+			"(e.eventName LIKE ?) AND (e.eventName LIKE ?)",
+			[]interface{}{"%louis%", "%xiv%"},
+		},
+		{
+			nil,
+			[]string{"e.eventName"},
+			"",
+			[]interface{}{},
+		},
+	}
+	for _, tt := range tests {
+		gotSQL, gotArgs := likeConditions(tt.terms, tt.columns...)
+		if gotSQL != tt.wantSQL || !reflect.DeepEqual(gotArgs, tt.wantArgs) {
+			t.Errorf("likeConditions(%q, %q) = %q, %v; want %q, %v", tt.terms, tt.columns, gotSQL, gotArgs, tt.wantSQL, tt.wantArgs)
+		}
+	}
+}
+
+// cacheTestConfig returns a Config whose database and cache live in a fresh
+// temporary directory
+func cacheTestConfig(t *testing.T) Config {
+	dir := t.TempDir()
+	config := Config{
+		DBPath:      filepath.Join(dir, dbName),
+		CacheFolder: filepath.Join(dir, "cache"),
+	}
+	if err := os.WriteFile(config.DBPath, []byte("db"), 0o644); err != nil {
+		t.Fatal(err)
+	}
+	return config
+}
+
+func TestQueryCachePathKey(t *testing.T) {
+	config := cacheTestConfig(t)
+	base := queryCachePath(config, "search", "true", "caesar")
+	if base == "" {
+		t.Fatal("queryCachePath returned no path with a cache folder set")
+	}
+	if again := queryCachePath(config, "search", "true", "caesar"); again != base {
+		t.Errorf("key is not stable: %q != %q", again, base)
+	}
+	if other := queryCachePath(config, "search", "true", "caesa"); other == base {
+		t.Error("key does not change with the query")
+	}
+
+	sourceConfig := config
+	sourceConfig.MySource = "ruler"
+	if got := queryCachePath(sourceConfig, "search", "true", "caesar"); got == base {
+		t.Error("key does not change with mySource")
+	}
+
+	oldVersion := cacheFormatVersion
+	cacheFormatVersion = oldVersion + "-test"
+	got := queryCachePath(config, "search", "true", "caesar")
+	cacheFormatVersion = oldVersion
+	if got == base {
+		t.Error("key does not change with cacheFormatVersion")
+	}
+
+	info, err := os.Stat(config.DBPath)
+	if err != nil {
+		t.Fatal(err)
+	}
+	if err := os.WriteFile(config.DBPath, []byte("bigger db"), 0o644); err != nil {
+		t.Fatal(err)
+	}
+	if err := os.Chtimes(config.DBPath, info.ModTime(), info.ModTime()); err != nil {
+		t.Fatal(err)
+	}
+	sized := queryCachePath(config, "search", "true", "caesar")
+	if sized == base {
+		t.Error("key does not change with the database size")
+	}
+	later := info.ModTime().Add(time.Hour)
+	if err := os.Chtimes(config.DBPath, later, later); err != nil {
+		t.Fatal(err)
+	}
+	if got := queryCachePath(config, "search", "true", "caesar"); got == sized {
+		t.Error("key does not change with the database mtime")
+	}
+
+	config.CacheFolder = ""
+	if got := queryCachePath(config, "search", "true", "caesar"); got != "" {
+		t.Errorf("queryCachePath without a cache folder = %q, want \"\"", got)
+	}
+}
+
+func TestStoreCachedLeavesOnlyResult(t *testing.T) {
+	config := cacheTestConfig(t)
+	path := queryCachePath(config, "search", "true", "caesar")
+	storeCached(path, []byte("{}\n"))
+
+	entries, err := os.ReadDir(filepath.Dir(path))
+	if err != nil {
+		t.Fatal(err)
+	}
+	if len(entries) != 1 || entries[0].Name() != filepath.Base(path) {
+		var names []string
+		for _, entry := range entries {
+			names = append(names, entry.Name())
+		}
+		t.Fatalf("cache folder holds %v, want only %s", names, filepath.Base(path))
+	}
+	if data, err := os.ReadFile(path); err != nil || string(data) != "{}\n" {
+		t.Errorf("cached result = %q, %v; want %q", data, err, "{}\n")
+	}
+}
+
+func TestCacheResultSkipsFailedSearches(t *testing.T) {
+	tests := []struct {
+		name      string
+		searchErr error
+		wantSaved bool
+	}{
+		{"success", nil, true},
+		{"no results", errNoResults, false},
+		{"query error", errors.New("database is locked"), false},
+	}
+	for _, tt := range tests {
+		config := cacheTestConfig(t)
+		path := queryCachePath(config, "search", "true", tt.name)
+		cacheResult(path, []byte("{}\n"), tt.searchErr)
+		_, err := os.Stat(path)
+		if saved := err == nil; saved != tt.wantSaved {
+			t.Errorf("%s: result cached = %v, want %v", tt.name, saved, tt.wantSaved)
+		}
+	}
+}
+
+func TestPruneQueryCache(t *testing.T) {
+	dir := t.TempDir()
+	touch := func(name string, modTime time.Time) {
+		path := filepath.Join(dir, name)
+		if err := os.WriteFile(path, []byte("{}"), 0o644); err != nil {
+			t.Fatal(err)
+		}
+		if err := os.Chtimes(path, modTime, modTime); err != nil {
+			t.Fatal(err)
+		}
+	}
+
+	const extra = 5
+	start := time.Now().Add(-24 * time.Hour)
+	for i := 0; i < maxCachedQueries+extra; i++ {
+		touch(fmt.Sprintf("%04d.json", i), start.Add(time.Duration(i)*time.Second))
+	}
+	touch("stale.tmp", time.Now().Add(-2*staleTempAge))
+	touch("fresh.tmp", time.Now())
+
+	pruneQueryCache(dir)
+
+	for i := 0; i < maxCachedQueries+extra; i++ {
+		_, err := os.Stat(filepath.Join(dir, fmt.Sprintf("%04d.json", i)))
+		if kept := err == nil; kept != (i >= extra) {
+			t.Errorf("%04d.json kept = %v, want %v", i, kept, i >= extra)
+		}
+	}
+	if _, err := os.Stat(filepath.Join(dir, "stale.tmp")); !os.IsNotExist(err) {
+		t.Error("stale temporary file was not removed")
+	}
+	if _, err := os.Stat(filepath.Join(dir, "fresh.tmp")); err != nil {
+		t.Error("fresh temporary file was removed")
+	}
+}
+
+func TestRemoveStaleDBCopies(t *testing.T) {
+	dir := t.TempDir()
+	stale := filepath.Join(dir, dbName+".123.tmp")
+	fresh := filepath.Join(dir, dbName+".456.tmp")
+	for _, path := range []string{stale, fresh} {
+		if err := os.WriteFile(path, []byte("db"), 0o600); err != nil {
+			t.Fatal(err)
+		}
+	}
+	old := time.Now().Add(-2 * staleTempAge)
+	if err := os.Chtimes(stale, old, old); err != nil {
+		t.Fatal(err)
+	}
+
+	removeStaleDBCopies(dir)
+
+	if _, err := os.Stat(stale); !os.IsNotExist(err) {
+		t.Error("stale database copy was not removed")
+	}
+	if _, err := os.Stat(fresh); err != nil {
+		t.Error("fresh database copy was removed")
+	}
+}